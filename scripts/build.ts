@@ -1,11 +1,21 @@
 import solidTransformPlugin from "@opentui/solid/bun-plugin";
 import { mkdir, rm } from "node:fs/promises";
-import { resolve } from "node:path";
+import { basename, resolve } from "node:path";
 
 const projectDir = resolve(import.meta.dir, "..");
 const distDir = resolve(projectDir, "dist");
 const outDir = resolve(projectDir, "release/artifacts");
 
+// Workers are spawned by URL at runtime, so they must be bundled as entrypoints too.
+// Every entry is emitted flat next to index.js: tool modules are inlined into that bundle,
+// and resolveWorkerUrl looks for their workers beside it.
+const entrypoints = [
+  resolve(projectDir, "src/index.tsx"),
+  resolve(projectDir, "src/tools/pdf-to-images.worker.ts"),
+  resolve(projectDir, "src/tools/compress.worker.ts"),
+];
+const naming = { entry: "[name].[ext]" };
+
 const targets = [
   { name: "darwin-arm64", bunTarget: "bun-darwin-arm64" },
   { name: "darwin-x64", bunTarget: "bun-darwin-x64" },
@@ -27,8 +37,9 @@ async function bundle(outdir: string): Promise<void> {
   await mkdir(outdir, { recursive: true });
 
   const result = await Bun.build({
-    entrypoints: [resolve(projectDir, "src/index.tsx")],
+    entrypoints,
     outdir,
+    naming,
     target: "bun",
     minify: true,
     sourcemap: "linked",
@@ -39,6 +50,12 @@ async function bundle(outdir: string): Promise<void> {
     for (const l of result.logs) console.error(l);
     die("Bundle failed");
   }
+
+  // resolveWorkerUrl looks for each worker as a .js file next to index.js
+  for (const entry of entrypoints.slice(1)) {
+    const worker = basename(entry).replace(/\.ts$/, ".js");
+    if (!(await Bun.file(resolve(outdir, worker)).exists())) die(`Missing ${worker} in bundle`);
+  }
   ok(`Bundle → ${outdir}`);
 }
 
@@ -51,7 +68,8 @@ async function compile(toBuild: (typeof targets)[number][]): Promise<void> {
     log(`Compiling ${t.name}...`);
 
     const result = await Bun.build({
-      entrypoints: [resolve(projectDir, "src/index.tsx")],
+      entrypoints,
+      naming,
       target: "bun",
       minify: true,
       sourcemap: "linked",
@@ -7,9 +7,14 @@ import { ButtonRow } from "./ui/button-row";
 import { FileList } from "./ui/file-list";
 import { Label } from "./ui/label";
 import { StatusBar } from "./ui/status-bar";
+import { Toggle } from "./ui/toggle";
+import { ToggleRow } from "./ui/toggle-row";
 import { ToolContainer } from "./ui/tool-container";
 import { useKeyboardNav } from "../hooks/useKeyboardNav";
 import { useFileListContext } from "../provider/fileListProvider";
+import type { CompressPDFInput } from "../model/models";
+
+type Quality = NonNullable<CompressPDFInput["quality"]>;
 
 interface CompressionResult {
   originalSize: number;
@@ -22,6 +27,7 @@ export function CompressUI() {
   const fl = useFileListContext();
   const nav = useKeyboardNav();
   const [result, setResult] = createSignal<CompressionResult | null>(null);
+  const [quality, setQuality] = createSignal<Quality>("medium");
 
   const canClearAll = () => fl.fileCount() > 0;
   const canCompress = () => fl.selectedFile() && !fl.isProcessing();
@@ -40,7 +46,7 @@ export function CompressUI() {
 
     try {
       const outputPath = await getOutputPath("compressed", file);
-      const res = await compressPDF({ inputPath: file, outputPath });
+      const res = await compressPDF({ inputPath: file, outputPath, quality: quality() });
 
       if (res.success && res.originalSize && res.compressedSize) {
         setResult({
@@ -96,6 +102,15 @@ export function CompressUI() {
       });
     });
 
+    // Register quality toggles
+    (["low", "medium", "high"] as const).forEach((level) => {
+      nav.registerElement({
+        id: `quality-${level}`,
+        type: "toggle",
+        onEnter: () => setQuality(level),
+      });
+    });
+
     // Register buttons
     nav.registerElement({
       id: "clear-all-btn",
@@ -149,6 +164,31 @@ export function CompressUI() {
         focusedButton={() => nav.getFocusedId()}
       />
 
+      <Label text="Image quality (images are re-encoded as JPEG)" paddingBottom={1} />
+      <ToggleRow>
+        <Toggle
+          label="Low"
+          value={"low" as Quality}
+          selected={quality()}
+          onSelect={setQuality}
+          focused={nav.isFocused("quality-low")}
+        />
+        <Toggle
+          label="Medium"
+          value={"medium" as Quality}
+          selected={quality()}
+          onSelect={setQuality}
+          focused={nav.isFocused("quality-medium")}
+        />
+        <Toggle
+          label="High"
+          value={"high" as Quality}
+          selected={quality()}
+          onSelect={setQuality}
+          focused={nav.isFocused("quality-high")}
+        />
+      </ToggleRow>
+
       <Show when={result()}>
         <box flexDirection="column" marginTop={1} paddingLeft={1} flexShrink={0}>
           <text attributes={TextAttributes.BOLD} fg="green" content={"Compression Result:"} />
@@ -6,6 +6,7 @@ import {
   openOutputFolder,
   savePdfDocument,
   loadPdfDocument,
+  parsePageSelection,
 } from "../utils/utils";
 import { Button } from "./ui/button";
 import { ButtonRow } from "./ui/button-row";
@@ -24,12 +25,7 @@ export function DeleteUI() {
   const [pagesInput, setPagesInput] = createSignal("");
   const [focusedInput, setFocusedInput] = createSignal<string | null>(null);
 
-  const parsePagesInput = () => {
-    return pagesInput()
-      .split(",")
-      .map((s) => parseInt(s.trim()))
-      .filter((n) => !isNaN(n) && n >= 1 && n <= fl.pageCount());
-  };
+  const parsePagesInput = () => parsePageSelection(pagesInput(), fl.pageCount());
 
   const canDelete = createMemo(() => {
     const file = fl.selectedFile();
@@ -203,10 +199,10 @@ export function DeleteUI() {
       </Show>
 
       <TextInput
-        label="Pages to delete (comma-separated, e.g., 1, 3, 5):"
+        label="Pages to delete (comma-separated or ranges, e.g., 1, 3, 5-8):"
         value={pagesInput}
         onInput={setPagesInput}
-        placeholder="1, 3, 5"
+        placeholder="1, 3, 5-8"
         focused={focusedInput() === "input-pages" || nav.isFocused("input-pages")}
         onFocus={() => setFocusedInput("input-pages")}
       />
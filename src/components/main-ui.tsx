@@ -1,15 +1,5 @@
 import { Dynamic, useTerminalDimensions } from "@opentui/solid";
-import { createEffect, createSignal, Show } from "solid-js";
-import { MergeUI } from "./merge";
-import { CompressUI } from "./compress";
-import { RotateUI } from "./rotate";
-import { SplitExtractUI } from "./split-extract";
-import { DeleteUI } from "./delete";
-import { PDFToImagesUI } from "./pdf-to-images";
-import { ImagesToPDFUI } from "./images-to-pdf";
-import { ProtectUI } from "./protect";
-import { DecryptUI } from "./decrypt";
-import { OrganiseUI } from "./organise";
+import { createEffect, createSignal, lazy, Show, type Component } from "solid-js";
 import { HeaderLayout } from "./header-layout";
 import { PDFPreviewPane } from "./pdf-preview";
 import { useFileListContext } from "../provider/fileListProvider";
@@ -21,17 +11,18 @@ interface MainUIProps {
   onBack: () => void;
 }
 
-const toolComponents: Record<string, () => any> = {
-  merge: MergeUI,
-  splitExtract: SplitExtractUI,
-  compress: CompressUI,
-  rotate: RotateUI,
-  delete: DeleteUI,
-  pdfToImages: PDFToImagesUI,
-  imagesToPDF: ImagesToPDFUI,
-  protect: ProtectUI,
-  decrypt: DecryptUI,
-  organise: OrganiseUI,
+// Tool screens load on first use, so only the selected tool's module graph is imported
+const toolComponents: Record<string, Component> = {
+  merge: lazy(() => import("./merge").then((m) => ({ default: m.MergeUI }))),
+  splitExtract: lazy(() => import("./split-extract").then((m) => ({ default: m.SplitExtractUI }))),
+  compress: lazy(() => import("./compress").then((m) => ({ default: m.CompressUI }))),
+  rotate: lazy(() => import("./rotate").then((m) => ({ default: m.RotateUI }))),
+  delete: lazy(() => import("./delete").then((m) => ({ default: m.DeleteUI }))),
+  pdfToImages: lazy(() => import("./pdf-to-images").then((m) => ({ default: m.PDFToImagesUI }))),
+  imagesToPDF: lazy(() => import("./images-to-pdf").then((m) => ({ default: m.ImagesToPDFUI }))),
+  protect: lazy(() => import("./protect").then((m) => ({ default: m.ProtectUI }))),
+  decrypt: lazy(() => import("./decrypt").then((m) => ({ default: m.DecryptUI }))),
+  organise: lazy(() => import("./organise").then((m) => ({ default: m.OrganiseUI }))),
 };
 
 export function MainUI(props: MainUIProps) {
@@ -1,6 +1,12 @@
 import { createSignal, createMemo, Show, createEffect, onCleanup } from "solid-js";
 import { rotatePDF } from "../tools/rotate";
-import { openFile, getOutputPath, openOutputFolder } from "../utils/utils";
+import {
+  openFile,
+  getOutputPath,
+  getPageCount,
+  openOutputFolder,
+  parsePageSelection,
+} from "../utils/utils";
 import { Button } from "./ui/button";
 import { ButtonRow } from "./ui/button-row";
 import { FileList } from "./ui/file-list";
@@ -44,12 +50,17 @@ export function RotateUI() {
       let pages: number[] | "all" = "all";
 
       if (pageMode() === "specific") {
-        pages = pagesInput()
-          .split(",")
-          .map((s) => parseInt(s.trim()))
-          .filter((n) => !isNaN(n));
+        // The page count loads asynchronously, so read it here if it has not arrived yet
+        const pageCount = fl.pageCount() || (await getPageCount(file));
+        if (pageCount === 0) {
+          fl.setStatus({ msg: "Could not read the pages of this PDF", type: "error" });
+          fl.setIsProcessing(false);
+          return;
+        }
+
+        pages = parsePageSelection(pagesInput(), pageCount);
         if (pages.length === 0) {
-          fl.setStatus({ msg: "Enter page numbers (e.g., 1, 2, 3)", type: "error" });
+          fl.setStatus({ msg: "Enter page numbers (e.g., 1, 2, 5-8)", type: "error" });
           fl.setIsProcessing(false);
           return;
         }
@@ -235,10 +246,10 @@ export function RotateUI() {
 
       <Show when={pageMode() === "specific"}>
         <TextInput
-          label="Pages (comma-separated, e.g., 1, 2, 3):"
+          label="Pages (comma-separated or ranges, e.g., 1, 2, 5-8):"
           value={pagesInput}
           onInput={setPagesInput}
-          placeholder="1, 2, 3"
+          placeholder="1, 2, 5-8"
           focused={focusedInput() === "input-pages" || nav.isFocused("input-pages")}
           onFocus={() => setFocusedInput("input-pages")}
         />
@@ -1,13 +1,16 @@
 import { KeyEvent, RGBA } from "@opentui/core";
 import { render, useKeyboard } from "@opentui/solid";
 import { ToolsMenu } from "./components/tools-menu";
-import { createSignal } from "solid-js";
+import { createSignal, lazy } from "solid-js";
 import { HIGHLIGHT_ACCENT_COLOR, toolsMenu } from "./constants/constants";
 import Hero from "./components/hero";
-import { MainUI } from "./components/main-ui";
 import { type FileListOptions } from "./model/models";
 import { FileListProvider } from "./provider/fileListProvider";
 
+// Loaded when the first tool is opened, keeping the PDF backends (and the MuPDF WASM
+// binary) off the startup path of the menu screen
+const MainUI = lazy(() => import("./components/main-ui").then((m) => ({ default: m.MainUI })));
+
 const toolFileListOptions: Record<string, FileListOptions> = {
   merge: {},
   compress: {},
@@ -24,6 +24,11 @@ export interface FileListOptions {
 
 // ============ Tool Input/Output Types ============
 
+// Reply posted by a tool worker when its task throws
+export interface WorkerErrorResult {
+  error: string;
+}
+
 // Compress
 export interface CompressPDFInput {
   inputPath: string;
@@ -40,6 +45,31 @@ export interface CompressPDFOutput {
   error?: string;
 }
 
+export interface RecompressedImage {
+  jpeg: Uint8Array;
+  width: number;
+  height: number;
+  isGray: boolean;
+}
+
+// How re-encoded images are written, per requested compress quality
+export interface JpegEncodeSettings {
+  jpegQuality: number;
+  // Longest side, in pixels, that re-encoded images are downscaled to fit
+  maxDimension: number;
+}
+
+// Message sent to a compress worker: re-encode a block of standalone JPEG streams
+export interface CompressImagesTask {
+  images: Uint8Array[];
+  settings: JpegEncodeSettings;
+}
+
+// One entry per task image, null where the image could not be decoded
+export interface CompressImagesResult {
+  images: (RecompressedImage | null)[];
+}
+
 // Delete
 export interface DeletePagesInput {
   inputPath: string;
@@ -89,6 +119,8 @@ export interface PDFToImagesInput {
   format?: "png" | "jpg";
   dpi?: number;
   pages?: number[] | "all";
+  // Keep a transparent background in PNG output (JPEG output is always opaque)
+  transparent?: boolean;
 }
 
 export interface PDFToImagesOutput {
@@ -98,6 +130,25 @@ export interface PDFToImagesOutput {
   error?: string;
 }
 
+export interface PDFToImagesRenderOptions {
+  dpi: number;
+  zoom: number;
+  format: string;
+  alpha: boolean;
+  outputDir: string;
+  baseName: string;
+}
+
+// Message sent to a pdf-to-images worker: render a contiguous block of pages of inputPath
+export interface PDFToImagesRenderTask extends PDFToImagesRenderOptions {
+  inputPath: string;
+  pageIndices: number[];
+}
+
+export interface PDFToImagesRenderResult {
+  outputPaths: string[];
+}
+
 // Protect
 export interface ProtectPDFInput {
   inputPath: string;
@@ -1,9 +1,335 @@
 import mupdf from "../utils/mupdf";
-import type { CompressPDFInput, CompressPDFOutput } from "../model/models";
+import type {
+  CompressImagesResult,
+  CompressImagesTask,
+  CompressPDFInput,
+  CompressPDFOutput,
+  JpegEncodeSettings,
+  RecompressedImage,
+} from "../model/models";
+import { getMaxWorkers, splitIntoBlocks } from "../utils/utils";
+import { resolveWorkerUrl, runInWorkers } from "../utils/worker-pool";
+
+type MupdfPDFDocument = InstanceType<typeof mupdf.PDFDocument>;
+type MupdfPDFObject = InstanceType<typeof mupdf.PDFObject>;
+type MupdfImage = InstanceType<typeof mupdf.Image>;
+
+const DEVICE_COLOR_COMPONENTS: Record<string, number> = {
+  DeviceGray: 1,
+  DeviceRGB: 3,
+  DeviceCMYK: 4,
+};
+
+interface ImageJob {
+  // Every image XObject sharing this exact stream and decoding parameters
+  refs: MupdfPDFObject[];
+  rawLength: number;
+}
+
+// Dictionary entries that, together with the raw stream bytes, determine the decoded image
+const IMAGE_DECODE_KEYS = [
+  "Filter",
+  "DecodeParms",
+  "Decode",
+  "ColorSpace",
+  "BitsPerComponent",
+  "Width",
+  "Height",
+];
+
+// Codecs for bilevel images: 1-bit scans that a JPEG would only blur
+const BILEVEL_FILTERS = new Set(["CCITTFaxDecode", "JBIG2Decode"]);
+
+// Image streams smaller than this are not worth re-encoding
+const RECOMPRESS_MIN_BYTES = 50 * 1024;
+// Images with fewer pixels than this are not worth re-encoding
+const RECOMPRESS_MIN_PIXELS = 100_000;
+// Below this many JPEG streams, spawning workers costs more than it saves
+const SEQUENTIAL_IMAGE_LIMIT = 2;
+// Re-encoding settings per requested output quality. Re-encoding is lossy; "high" keeps
+// full resolution, lower levels also downscale images to fit within maxDimension pixels.
+const QUALITY_SETTINGS: Record<NonNullable<CompressPDFInput["quality"]>, JpegEncodeSettings> = {
+  low: { jpegQuality: 50, maxDimension: 1500 },
+  medium: { jpegQuality: 75, maxDimension: 2000 },
+  high: { jpegQuality: 90, maxDimension: Infinity },
+};
+
+/**
+ * Collects every image XObject in the document in a single pass over the object table,
+ * so each image is listed exactly once however many pages (or forms) reference it.
+ * Images used as another image's SMask or Mask are left out: they carry alpha or
+ * stencil data, not picture content.
+ */
+function collectImages(pdfDoc: MupdfPDFDocument): MupdfPDFObject[] {
+  const images: MupdfPDFObject[] = [];
+  const maskObjects = new Set<number>();
+
+  const objectCount = pdfDoc.countObjects();
+
+  for (let num = 1; num < objectCount; num++) {
+    const ref = pdfDoc.newIndirect(num);
+    const obj = ref.resolve();
+    if (!obj.isStream() || obj.get("Subtype").asName() !== "Image") continue;
+
+    images.push(ref);
+    for (const key of ["SMask", "Mask"]) {
+      const mask = obj.get(key);
+      if (mask.isIndirect()) maskObjects.add(mask.asIndirect());
+    }
+  }
+
+  return images.filter((ref) => !maskObjects.has(ref.asIndirect()));
+}
+
+/**
+ * Decodes an image and re-encodes it as a JPEG, downscaled to fit settings.maxDimension.
+ * The image is drawn straight into a pixmap at the target size, so oversized JPEGs are
+ * decoded through libjpeg's DCT scaling rather than at full resolution. The image is
+ * destroyed once encoded so WASM memory is released before the next one.
+ */
+export function encodeImageAsJpeg(
+  image: MupdfImage,
+  settings: JpegEncodeSettings,
+): RecompressedImage {
+  const width = image.getWidth();
+  const height = image.getHeight();
+  const scale = Math.min(1, settings.maxDimension / Math.max(width, height));
+  const targetWidth = Math.max(1, Math.round(width * scale));
+  const targetHeight = Math.max(1, Math.round(height * scale));
+
+  const isGray = image.getColorSpace()?.isGray() ?? false;
+  const colorspace = isGray ? mupdf.ColorSpace.DeviceGray : mupdf.ColorSpace.DeviceRGB;
+  const pixmap = new mupdf.Pixmap(colorspace, [0, 0, targetWidth, targetHeight], false);
+  const device = new mupdf.DrawDevice(mupdf.Matrix.identity, pixmap);
+
+  try {
+    pixmap.clear(255);
+    device.fillImage(image, [targetWidth, 0, 0, targetHeight, 0, 0], 1);
+    device.close();
+
+    return {
+      jpeg: pixmap.asJPEG(settings.jpegQuality, false),
+      width: targetWidth,
+      height: targetHeight,
+      isGray,
+    };
+  } finally {
+    device.destroy();
+    pixmap.destroy();
+    image.destroy();
+  }
+}
+
+/**
+ * Loads and re-encodes an image like encodeImageAsJpeg, but returns null when MuPDF
+ * cannot decode it (damaged data, unsupported JPX or JBIG2 variants), so that image is
+ * left as it was instead of failing the whole file
+ */
+export function tryEncodeImageAsJpeg(
+  loadImage: () => MupdfImage,
+  settings: JpegEncodeSettings,
+): RecompressedImage | null {
+  try {
+    return encodeImageAsJpeg(loadImage(), settings);
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Replaces the stream of each image XObject in the job with the re-encoded JPEG,
+ * only if it was re-encoded and is smaller
+ */
+function applyRecompressedImage(
+  pdfDoc: MupdfPDFDocument,
+  job: ImageJob,
+  result: RecompressedImage | null,
+): void {
+  if (!result || result.jpeg.byteLength >= job.rawLength) return;
+
+  for (const ref of job.refs) {
+    const obj = ref.resolve();
+    obj.writeRawStream(result.jpeg);
+    obj.put("Filter", pdfDoc.newName("DCTDecode"));
+    obj.delete("DecodeParms");
+    obj.delete("Decode");
+    obj.put("ColorSpace", pdfDoc.newName(result.isGray ? "DeviceGray" : "DeviceRGB"));
+    obj.put("BitsPerComponent", 8);
+    obj.put("Width", result.width);
+    obj.put("Height", result.height);
+  }
+}
+
+/**
+ * Content key for an image: a hash of its raw stream plus the dictionary entries that
+ * affect decoding, so byte-identical images stored under different objects match
+ */
+function getImageKey(obj: MupdfPDFObject, raw: Uint8Array): string {
+  const hasher = new Bun.CryptoHasher("sha1");
+  hasher.update(raw);
+  for (const key of IMAGE_DECODE_KEYS) {
+    hasher.update(`/${key} ${obj.get(key).toString()}`);
+  }
+  return hasher.digest("hex");
+}
+
+/**
+ * Number of colour components of an image colour space, when it can be read from the
+ * dictionary alone. Indexed spaces count their base space. Null for spaces that cannot
+ * be flattened to gray or RGB without a colour shift (Separation, DeviceN, Lab, etc.)
+ */
+function getColorComponents(colorspace: MupdfPDFObject): number | null {
+  if (colorspace.isName()) {
+    return DEVICE_COLOR_COMPONENTS[colorspace.asName()] ?? null;
+  }
+  if (!colorspace.isArray()) return null;
+
+  const family = colorspace.get(0).asName();
+  if (family === "ICCBased") return colorspace.get(1).get("N").asNumber();
+  if (family === "Indexed") return getColorComponents(colorspace.get(1));
+  return null;
+}
+
+/**
+ * Names of the filters applied to a stream, in order
+ */
+function getFilterNames(obj: MupdfPDFObject): string[] {
+  const filter = obj.get("Filter");
+  if (filter.isName()) return [filter.asName()];
+  if (!filter.isArray()) return [];
+
+  const names: string[] = [];
+  for (let i = 0; i < filter.length; i++) names.push(filter.get(i).asName());
+  return names;
+}
+
+/**
+ * Cheap pre-filter on the image dictionary, evaluated before any stream data is read
+ * or decoded: skips small images, masks, bilevel or low-depth images, and images whose
+ * colours would shift when flattened to gray or RGB JPEG (CMYK, spot colours, unreadable
+ * colour spaces)
+ */
+function isRecompressCandidate(obj: MupdfPDFObject): boolean {
+  if (obj.get("Length").asNumber() < RECOMPRESS_MIN_BYTES) return false;
+  if (obj.get("Width").asNumber() * obj.get("Height").asNumber() < RECOMPRESS_MIN_PIXELS) {
+    return false;
+  }
+
+  // Stencil masks and colour-key masks depend on the exact source samples
+  if (obj.get("ImageMask").asBoolean() || obj.get("Mask").isArray()) return false;
+
+  // Bilevel and low-depth images are crisp line art or scanned text, not photos
+  const bitsPerComponent = obj.get("BitsPerComponent");
+  if (bitsPerComponent.isNumber() && bitsPerComponent.asNumber() < 8) return false;
+  if (getFilterNames(obj).some((name) => BILEVEL_FILTERS.has(name))) return false;
+
+  const components = getColorComponents(obj.get("ColorSpace"));
+  return components !== null && components <= 3;
+}
+
+/**
+ * A plain DCTDecode stream in a device colour space is a complete JPEG file that decodes
+ * the same without the document. Decode arrays and decode parameters would change its
+ * meaning, and an ICC profile from the PDF would be ignored by a standalone decode.
+ */
+function isStandaloneJpeg(obj: MupdfPDFObject): boolean {
+  const colorspace = obj.get("ColorSpace");
+  return (
+    obj.get("Filter").asName() === "DCTDecode" &&
+    obj.get("DecodeParms").isNull() &&
+    obj.get("Decode").isNull() &&
+    colorspace.isName() &&
+    (colorspace.asName() === "DeviceGray" || colorspace.asName() === "DeviceRGB")
+  );
+}
+
+/**
+ * Re-encodes images across the worker pool, one contiguous block of images per worker.
+ * The image buffers are transferred to the workers, so they are unusable afterwards.
+ * @returns Re-encoded images (null where decoding failed), in the same order as the input
+ */
+async function encodeJpegsInWorkers(
+  images: Uint8Array[],
+  settings: JpegEncodeSettings,
+): Promise<(RecompressedImage | null)[]> {
+  const blocks = splitIntoBlocks(images, getMaxWorkers(images.length));
+  const tasks = blocks.map((block): CompressImagesTask => ({ images: block, settings }));
+
+  const results = await runInWorkers<CompressImagesTask, CompressImagesResult>(
+    resolveWorkerUrl("compress.worker", import.meta.url),
+    tasks,
+    (task) => task.images.map((image) => image.buffer as ArrayBuffer),
+  );
+  return results.flatMap((result) => result.images);
+}
+
+/**
+ * Re-encodes large images as JPEG. Candidates are collected first; standalone JPEG
+ * streams are decoded and re-encoded in workers, everything else on the main thread,
+ * and the document itself is only modified on the main thread. Byte-identical images
+ * are encoded once and shared; images that fail to decode are skipped.
+ */
+async function recompressImages(
+  pdfDoc: MupdfPDFDocument,
+  settings: JpegEncodeSettings,
+): Promise<void> {
+  const workerJobs: ImageJob[] = [];
+  const workerImages: Uint8Array[] = [];
+  const mainJobs: ImageJob[] = [];
+  const jobsByKey = new Map<string, ImageJob>();
+
+  for (const ref of collectImages(pdfDoc)) {
+    const obj = ref.resolve();
+    if (!isRecompressCandidate(obj)) continue;
+
+    // Copied out of the WASM heap into its own buffer, which can be moved to a worker
+    const rawStream = obj.readRawStream();
+    const raw = rawStream.asUint8Array().slice();
+    rawStream.destroy();
+    const key = getImageKey(obj, raw);
+    const existing = jobsByKey.get(key);
+    if (existing) {
+      existing.refs.push(ref);
+      continue;
+    }
+
+    const job: ImageJob = { refs: [ref], rawLength: raw.byteLength };
+    jobsByKey.set(key, job);
+
+    if (isStandaloneJpeg(obj)) {
+      workerJobs.push(job);
+      workerImages.push(raw);
+    } else {
+      mainJobs.push(job);
+    }
+  }
+
+  if (workerImages.length > SEQUENTIAL_IMAGE_LIMIT) {
+    // The buffers now belong to the workers; if they cannot run (e.g. the worker script
+    // fails to load), those images are decoded from the document on the main thread
+    const workerResults = await encodeJpegsInWorkers(workerImages, settings).catch(() => null);
+    if (workerResults) {
+      workerJobs.forEach((job, i) => applyRecompressedImage(pdfDoc, job, workerResults[i] ?? null));
+    } else {
+      mainJobs.push(...workerJobs);
+    }
+  } else {
+    workerJobs.forEach((job, i) => {
+      const result = tryEncodeImageAsJpeg(() => new mupdf.Image(workerImages[i]!), settings);
+      applyRecompressedImage(pdfDoc, job, result);
+    });
+  }
+
+  for (const job of mainJobs) {
+    const result = tryEncodeImageAsJpeg(() => pdfDoc.loadImage(job.refs[0]!), settings);
+    applyRecompressedImage(pdfDoc, job, result);
+  }
+}
 
 /**
  * Compresses a PDF file using MuPDF WASM
- * Performs: garbage collection, image recompression, stream deflation, font compression
+ * Performs: JPEG re-encoding of large images, garbage collection, image recompression,
+ * stream deflation, font compression
  * @param input - Input PDF path and output path
  * @returns Result with success status, file sizes, and compression ratio
  */
@@ -13,18 +339,29 @@ export async function compressPDF(input: CompressPDFInput): Promise<CompressPDFO
     const pdfBytes = await Bun.file(input.inputPath).arrayBuffer();
 
     const doc = mupdf.Document.openDocument(pdfBytes, "application/pdf");
-    const pdfDoc = doc.asPDF();
-    if (!pdfDoc) {
-      return { success: false, error: "Not a valid PDF document" };
-    }
+    let compressedSize: number;
+    try {
+      const pdfDoc = doc.asPDF();
+      if (!pdfDoc) {
+        return { success: false, error: "Not a valid PDF document" };
+      }
 
-    const buf = pdfDoc.saveToBuffer(
-      "garbage=deduplicate,compress,compress-images,compress-fonts,clean,sanitize",
-    );
-    const compressed = buf.asUint8Array();
-    await Bun.write(input.outputPath, compressed);
+      await recompressImages(pdfDoc, QUALITY_SETTINGS[input.quality || "medium"]);
+
+      const buf = pdfDoc.saveToBuffer(
+        "garbage=deduplicate,compress,compress-images,compress-fonts,clean,sanitize",
+      );
+      try {
+        const compressed = buf.asUint8Array();
+        await Bun.write(input.outputPath, compressed);
+        compressedSize = compressed.byteLength;
+      } finally {
+        buf.destroy();
+      }
+    } finally {
+      doc.destroy();
+    }
 
-    const compressedSize = compressed.byteLength;
     const ratio = originalSize > 0 ? (1 - compressedSize / originalSize) * 100 : 0;
 
     return {
@@ -0,0 +1,26 @@
+import mupdf from "../utils/mupdf";
+import { tryEncodeImageAsJpeg } from "./compress";
+import type {
+  CompressImagesResult,
+  CompressImagesTask,
+  WorkerErrorResult,
+} from "../model/models";
+
+declare var self: Worker;
+
+// Decodes and re-encodes a block of standalone JPEG streams per message; an image that
+// fails to decode comes back as null so the rest of the block is still used
+self.onmessage = (event: MessageEvent<CompressImagesTask>) => {
+  const task = event.data;
+  let result: CompressImagesResult | WorkerErrorResult;
+
+  try {
+    const encode = (bytes: Uint8Array) =>
+      tryEncodeImageAsJpeg(() => new mupdf.Image(bytes), task.settings);
+    result = { images: task.images.map(encode) };
+  } catch (error) {
+    result = { error: error instanceof Error ? error.message : "Unknown error occurred" };
+  }
+
+  postMessage(result);
+};
@@ -1,9 +1,177 @@
-import { PDFDocument } from "pdf-lib";
+import mupdf from "../utils/mupdf";
 import type { ImagesToPDFInput, ImagesToPDFOutput } from "../model/models";
-import { savePdfDocument } from "../utils/utils";
+
+type MupdfPDFDocument = InstanceType<typeof mupdf.PDFDocument>;
+type MupdfPDFObject = InstanceType<typeof mupdf.PDFObject>;
+
+interface EmbeddedImage {
+  ref: MupdfPDFObject;
+  width: number;
+  height: number;
+}
+
+interface PngImageData {
+  width: number;
+  height: number;
+  components: number;
+  bitDepth: number;
+  // Concatenated IDAT chunk data
+  data: Uint8Array;
+}
+
+// Number of image files read ahead of the one being embedded
+const IMAGE_READ_AHEAD = 8;
+
+// SOFn markers carry the frame size; C4 (DHT), C8 (JPG) and CC (DAC) share the range
+const JPEG_SOF_MARKERS = new Set([
+  0xc0, 0xc1, 0xc2, 0xc3, 0xc5, 0xc6, 0xc7, 0xc9, 0xca, 0xcb, 0xcd, 0xce, 0xcf,
+]);
+
+/**
+ * Reads width, height, component count and sample precision from a JPEG's SOF marker
+ * without decoding it
+ * @returns Frame info, or null if the bytes are not a JPEG with a readable SOF segment
+ */
+export function readJpegInfo(
+  bytes: Uint8Array,
+): { width: number; height: number; components: number; precision: number } | null {
+  if (bytes[0] !== 0xff || bytes[1] !== 0xd8) return null;
+
+  const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  let offset = 2;
+
+  while (offset + 9 < bytes.length) {
+    if (bytes[offset] !== 0xff) return null;
+    const marker = bytes[offset + 1]!;
+    if (marker === 0xff) {
+      offset++; // fill byte
+      continue;
+    }
+
+    if (JPEG_SOF_MARKERS.has(marker)) {
+      const precision = bytes[offset + 4]!;
+      const height = view.getUint16(offset + 5);
+      const width = view.getUint16(offset + 7);
+      const components = bytes[offset + 9]!;
+      return width > 0 && height > 0 ? { width, height, components, precision } : null;
+    }
+
+    offset += 2 + view.getUint16(offset + 2);
+  }
+
+  return null;
+}
+
+// PNG colour types that map directly onto a PDF colour space: 0 = gray, 2 = RGB
+const PNG_COLOR_COMPONENTS: Record<number, number> = { 0: 1, 2: 3 };
+const PNG_SIGNATURE = [0x89, 0x50, 0x4e, 0x47, 0x0d, 0x0a, 0x1a, 0x0a];
+
+/**
+ * Reads a PNG whose compressed data a PDF can use unchanged: the concatenated IDAT
+ * chunks form a zlib stream that FlateDecode with the PNG predictor decodes to the
+ * same samples. Only non-interlaced gray or RGB images of up to 8 bits, without
+ * transparency or an embedded ICC profile, qualify.
+ * @returns Image info and the IDAT data, or null if the PNG must be decoded instead
+ */
+export function readPngImageData(bytes: Uint8Array): PngImageData | null {
+  if (bytes.length < 33 || PNG_SIGNATURE.some((b, i) => bytes[i] !== b)) return null;
+
+  const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  const width = view.getUint32(16);
+  const height = view.getUint32(20);
+  const bitDepth = bytes[24]!;
+  const components = PNG_COLOR_COMPONENTS[bytes[25]!];
+  if (!components || bitDepth > 8 || bytes[28] !== 0 || width === 0 || height === 0) {
+    return null;
+  }
+
+  const idat: Uint8Array[] = [];
+  let offset = 8;
+
+  while (offset + 8 <= bytes.length) {
+    const length = view.getUint32(offset);
+    const type = String.fromCharCode(...bytes.subarray(offset + 4, offset + 8));
+    const chunk = bytes.subarray(offset + 8, offset + 8 + length);
+
+    if (type === "IDAT") idat.push(chunk);
+    else if (type === "tRNS" || type === "iCCP") return null;
+    else if (type === "IEND") break;
+
+    offset += 12 + length;
+  }
+
+  if (idat.length === 0) return null;
+  const data = idat.length === 1 ? idat[0]! : Buffer.concat(idat);
+  return { width, height, components, bitDepth, data };
+}
+
+/**
+ * Adds an image to the document. 8-bit gray and RGB JPEGs are written as DCTDecode streams
+ * straight from the file bytes, sized from the SOF header, and plain gray or RGB PNGs
+ * as FlateDecode streams straight from their IDAT data; everything else (PNGs with
+ * alpha or a palette, CMYK or 12-bit JPEG) goes through MuPDF's image loader.
+ */
+function embedImage(pdfDoc: MupdfPDFDocument, bytes: Uint8Array): EmbeddedImage {
+  const jpegInfo = readJpegInfo(bytes);
+
+  if (
+    jpegInfo &&
+    jpegInfo.precision === 8 &&
+    (jpegInfo.components === 1 || jpegInfo.components === 3)
+  ) {
+    const ref = pdfDoc.addRawStream(bytes, {
+      Type: pdfDoc.newName("XObject"),
+      Subtype: pdfDoc.newName("Image"),
+      Width: jpegInfo.width,
+      Height: jpegInfo.height,
+      ColorSpace: pdfDoc.newName(jpegInfo.components === 1 ? "DeviceGray" : "DeviceRGB"),
+      BitsPerComponent: 8,
+      Filter: pdfDoc.newName("DCTDecode"),
+    });
+    return { ref, width: jpegInfo.width, height: jpegInfo.height };
+  }
+
+  const pngData = readPngImageData(bytes);
+
+  if (pngData) {
+    const ref = pdfDoc.addRawStream(pngData.data, {
+      Type: pdfDoc.newName("XObject"),
+      Subtype: pdfDoc.newName("Image"),
+      Width: pngData.width,
+      Height: pngData.height,
+      ColorSpace: pdfDoc.newName(pngData.components === 1 ? "DeviceGray" : "DeviceRGB"),
+      BitsPerComponent: pngData.bitDepth,
+      Filter: pdfDoc.newName("FlateDecode"),
+      DecodeParms: {
+        Predictor: 15,
+        Colors: pngData.components,
+        BitsPerComponent: pngData.bitDepth,
+        Columns: pngData.width,
+      },
+    });
+    return { ref, width: pngData.width, height: pngData.height };
+  }
+
+  const image = new mupdf.Image(bytes);
+  try {
+    return { ref: pdfDoc.addImage(image), width: image.getWidth(), height: image.getHeight() };
+  } finally {
+    image.destroy();
+  }
+}
 
 /**
- * Converts multiple images into a single PDF file using pdf-lib
+ * Formats a number for a content stream. PDF numbers have no exponent form, so float
+ * residues such as 5.7e-14 from centring the image are rounded away.
+ */
+function formatPdfNumber(n: number): string {
+  return String(Number(n.toFixed(4)));
+}
+
+/**
+ * Converts multiple images into a single PDF file using MuPDF WASM.
+ * JPEGs and plain gray or RGB PNGs are embedded as-is (no decode or re-encode) and only
+ * their headers are read to size the page.
  * @param input - Image paths, output path, and page size options
  * @returns Result with success status and page count
  */
@@ -25,57 +193,80 @@ export async function imagesToPDF(input: ImagesToPDFInput): Promise<ImagesToPDFO
       };
     }
 
-    const pdfDoc = await PDFDocument.create();
+    const pdfDoc = new mupdf.PDFDocument();
     const pageSize = input.pageSize || "fit";
 
-    for (const imgPath of validImages) {
-      const imgBytes = await Bun.file(imgPath).arrayBuffer();
-      const ext = imgPath.toLowerCase();
-
-      const image = ext.endsWith(".png")
-        ? await pdfDoc.embedPng(imgBytes)
-        : await pdfDoc.embedJpg(imgBytes);
-
-      const imgWidth = image.width;
-      const imgHeight = image.height;
-
-      let pageWidth: number;
-      let pageHeight: number;
-
-      if (pageSize === "a4") {
-        pageWidth = 595.28;
-        pageHeight = 841.89;
-      } else if (pageSize === "letter") {
-        pageWidth = 612;
-        pageHeight = 792;
-      } else {
-        // "fit" - page matches image dimensions
-        pageWidth = imgWidth;
-        pageHeight = imgHeight;
-      }
+    try {
+      // Keep several file reads in flight so disk I/O overlaps with embedding; the queue
+      // drops each buffer once embedded so at most IMAGE_READ_AHEAD files are held
+      const reads: Promise<ArrayBuffer>[] = [];
+      const startRead = (index: number) => {
+        const read = Bun.file(validImages[index]!).arrayBuffer();
+        read.catch(() => {}); // surfaced when awaited below; avoids unhandled rejections
+        reads.push(read);
+      };
+      for (let i = 0; i < Math.min(IMAGE_READ_AHEAD, validImages.length); i++) startRead(i);
+
+      for (let i = 0; i < validImages.length; i++) {
+        const imgBytes = new Uint8Array(await reads.shift()!);
+        if (i + IMAGE_READ_AHEAD < validImages.length) startRead(i + IMAGE_READ_AHEAD);
+        const {
+          ref: imageRef,
+          width: imgWidth,
+          height: imgHeight,
+        } = embedImage(pdfDoc, imgBytes);
+
+        let pageWidth: number;
+        let pageHeight: number;
+
+        if (pageSize === "a4") {
+          pageWidth = 595.28;
+          pageHeight = 841.89;
+        } else if (pageSize === "letter") {
+          pageWidth = 612;
+          pageHeight = 792;
+        } else {
+          // "fit" - page matches image dimensions
+          pageWidth = imgWidth;
+          pageHeight = imgHeight;
+        }
+
+        let x = 0;
+        let y = 0;
+        let drawWidth = imgWidth;
+        let drawHeight = imgHeight;
+
+        if (pageSize !== "fit") {
+          // Scale image to fit page, centered
+          const scale = Math.min(pageWidth / imgWidth, pageHeight / imgHeight);
+          drawWidth = imgWidth * scale;
+          drawHeight = imgHeight * scale;
+          x = (pageWidth - drawWidth) / 2;
+          y = (pageHeight - drawHeight) / 2;
+        }
 
-      const page = pdfDoc.addPage([pageWidth, pageHeight]);
-
-      if (pageSize !== "fit") {
-        // Scale image to fit page, centered
-        const scale = Math.min(pageWidth / imgWidth, pageHeight / imgHeight);
-        const newWidth = imgWidth * scale;
-        const newHeight = imgHeight * scale;
-        const x = (pageWidth - newWidth) / 2;
-        const y = (pageHeight - newHeight) / 2;
-        page.drawImage(image, { x, y, width: newWidth, height: newHeight });
-      } else {
-        page.drawImage(image, { x: 0, y: 0, width: imgWidth, height: imgHeight });
+        const resources = pdfDoc.addObject({ XObject: { Im0: imageRef } });
+        const [w, h, tx, ty] = [drawWidth, drawHeight, x, y].map(formatPdfNumber);
+        const contents = `q ${w} 0 0 ${h} ${tx} ${ty} cm /Im0 Do Q`;
+        const page = pdfDoc.addPage([0, 0, pageWidth, pageHeight], 0, resources, contents);
+        pdfDoc.insertPage(-1, page);
       }
-    }
 
-    await savePdfDocument(pdfDoc, input.outputPath);
+      const buf = pdfDoc.saveToBuffer("compress");
+      try {
+        await Bun.write(input.outputPath, buf.asUint8Array());
+      } finally {
+        buf.destroy();
+      }
 
-    return {
-      success: true,
-      outputPath: input.outputPath,
-      totalPages: pdfDoc.getPageCount(),
-    };
+      return {
+        success: true,
+        outputPath: input.outputPath,
+        totalPages: pdfDoc.countPages(),
+      };
+    } finally {
+      pdfDoc.destroy();
+    }
   } catch (error) {
     return {
       success: false,
@@ -1,7 +1,104 @@
 import mupdf from "../utils/mupdf";
 import { mkdir } from "fs/promises";
 import { join, basename } from "path";
-import type { PDFToImagesInput, PDFToImagesOutput } from "../model/models";
+import type {
+  PDFToImagesInput,
+  PDFToImagesOutput,
+  PDFToImagesRenderOptions,
+  PDFToImagesRenderResult,
+  PDFToImagesRenderTask,
+} from "../model/models";
+import { getMaxWorkers, splitIntoBlocks } from "../utils/utils";
+import { resolveWorkerUrl, runInWorkers } from "../utils/worker-pool";
+
+type MupdfDocument = ReturnType<typeof mupdf.Document.openDocument>;
+
+// Below this many pages, spawning workers costs more than it saves
+const SEQUENTIAL_PAGE_LIMIT = 2;
+const RENDER_COLORSPACE = mupdf.ColorSpace.DeviceRGB;
+
+/**
+ * Renders and encodes a single page of an open document
+ * @param doc - Open MuPDF document
+ * @param pageIdx - 0-based page index
+ * @param options - Resolution, image format, alpha, output directory and file base name
+ * @returns Output path for the page and the encoded image bytes
+ */
+function renderPage(
+  doc: MupdfDocument,
+  pageIdx: number,
+  options: PDFToImagesRenderOptions,
+): { outputPath: string; data: Uint8Array } {
+  const page = doc.loadPage(pageIdx);
+  const matrix = mupdf.Matrix.scale(options.zoom, options.zoom);
+  const ext = options.format.toLowerCase();
+  const outputPath = join(options.outputDir, `${options.baseName}_page_${pageIdx + 1}.${ext}`);
+  const isJpeg = ext === "jpg" || ext === "jpeg";
+
+  // JPEG is always rendered without alpha (asJPEG throws on alpha pixmaps)
+  const pixmap = page.toPixmap(matrix, RENDER_COLORSPACE, options.alpha && !isJpeg, true);
+  try {
+    // Record the DPI in the image so viewers show it at the page's physical size
+    pixmap.setResolution(options.dpi, options.dpi);
+    return { outputPath, data: isJpeg ? pixmap.asJPEG(90, false) : pixmap.asPNG() };
+  } finally {
+    pixmap.destroy();
+    page.destroy();
+  }
+}
+
+/**
+ * Renders a list of pages of an open document in order.
+ * Each page's file write overlaps with rendering the next page; at most one write is
+ * in flight, so only one encoded page is held in memory while waiting on disk.
+ * @returns Paths of the written images, in the same order as pageIndices
+ */
+export async function renderPagesToFiles(
+  doc: MupdfDocument,
+  pageIndices: number[],
+  options: PDFToImagesRenderOptions,
+): Promise<string[]> {
+  const outputFiles: string[] = [];
+  let pendingWrite: Promise<number> = Promise.resolve(0);
+
+  try {
+    for (const pageIdx of pageIndices) {
+      const { outputPath, data } = renderPage(doc, pageIdx, options);
+      await pendingWrite;
+      pendingWrite = Bun.write(outputPath, data);
+      outputFiles.push(outputPath);
+    }
+
+    await pendingWrite;
+  } finally {
+    // If rendering throws, the write still in flight must not reject unhandled
+    await pendingWrite.catch(() => {});
+  }
+
+  return outputFiles;
+}
+
+/**
+ * Renders pages across the worker pool, one contiguous block of pages per worker.
+ * Each worker opens the document once for its whole block and only sends back
+ * output paths; results are flattened back into page order.
+ */
+async function renderPagesInWorkers(
+  inputPath: string,
+  pageIndices: number[],
+  options: PDFToImagesRenderOptions,
+): Promise<string[]> {
+  const blocks = splitIntoBlocks(pageIndices, getMaxWorkers(pageIndices.length));
+  const tasks = blocks.map(
+    (block): PDFToImagesRenderTask => ({ ...options, inputPath, pageIndices: block }),
+  );
+
+  const results = await runInWorkers<PDFToImagesRenderTask, PDFToImagesRenderResult>(
+    resolveWorkerUrl("pdf-to-images.worker", import.meta.url),
+    tasks,
+  );
+  return results.flatMap((result) => result.outputPaths);
+}
 
 /**
  * Converts PDF pages to images using MuPDF WASM
@@ -16,13 +113,17 @@ export async function pdfToImages(input: PDFToImagesInput): Promise<PDFToImagesO
     const doc = mupdf.Document.openDocument(pdfBytes, "application/pdf");
     const totalPages = doc.countPages();
 
-    const baseName = basename(input.inputPath, ".pdf");
-    const format = input.format || "png";
     const dpi = input.dpi || 150;
-
-    // DPI to zoom factor (72 DPI is base)
-    const zoom = dpi / 72;
-    const matrix = mupdf.Matrix.scale(zoom, zoom);
+    const options: PDFToImagesRenderOptions = {
+      dpi,
+      // DPI to zoom factor (72 DPI is base)
+      zoom: dpi / 72,
+      format: input.format || "png",
+      // An alpha channel adds a quarter to every pixmap; only keep it when asked for
+      alpha: input.transparent ?? false,
+      outputDir: input.outputDir,
+      baseName: basename(input.inputPath, ".pdf"),
+    };
 
     // Determine which pages to convert (input is 1-based)
     let pageIndices: number[];
@@ -32,25 +133,15 @@ export async function pdfToImages(input: PDFToImagesInput): Promise<PDFToImagesO
       pageIndices = Array.from({ length: totalPages }, (_, i) => i);
     }
 
-    const outputFiles: string[] = [];
+    let outputFiles: string[];
 
-    for (const pageIdx of pageIndices) {
-      const page = doc.loadPage(pageIdx);
-      const ext = format.toLowerCase();
-      const outputPath = join(input.outputDir, `${baseName}_page_${pageIdx + 1}.${ext}`);
-
-      if (ext === "jpg" || ext === "jpeg") {
-        // JPEG: render without alpha (asJPEG throws on alpha pixmaps)
-        const pixmap = page.toPixmap(matrix, mupdf.ColorSpace.DeviceRGB, false, true);
-        const buf = pixmap.asJPEG(90, false);
-        await Bun.write(outputPath, buf);
-      } else {
-        const pixmap = page.toPixmap(matrix, mupdf.ColorSpace.DeviceRGB, true, true);
-        const buf = pixmap.asPNG();
-        await Bun.write(outputPath, buf);
-      }
-
-      outputFiles.push(outputPath);
+    if (pageIndices.length <= SEQUENTIAL_PAGE_LIMIT) {
+      outputFiles = await renderPagesToFiles(doc, pageIndices, options);
+    } else {
+      // If workers cannot run (e.g. the worker script fails to load), render in-process
+      outputFiles = await renderPagesInWorkers(input.inputPath, pageIndices, options).catch(() =>
+        renderPagesToFiles(doc, pageIndices, options),
+      );
     }
 
     return {
@@ -0,0 +1,29 @@
+import mupdf from "../utils/mupdf";
+import { renderPagesToFiles } from "./pdf-to-images";
+import type {
+  PDFToImagesRenderResult,
+  PDFToImagesRenderTask,
+  WorkerErrorResult,
+} from "../model/models";
+
+declare var self: Worker;
+
+// Renders a block of pages per message, opening the document once for the whole block
+self.onmessage = async (event: MessageEvent<PDFToImagesRenderTask>) => {
+  const task = event.data;
+  let result: PDFToImagesRenderResult | WorkerErrorResult;
+
+  try {
+    const pdfBytes = await Bun.file(task.inputPath).arrayBuffer();
+    const doc = mupdf.Document.openDocument(pdfBytes, "application/pdf");
+    try {
+      result = { outputPaths: await renderPagesToFiles(doc, task.pageIndices, task) };
+    } finally {
+      doc.destroy();
+    }
+  } catch (error) {
+    result = { error: error instanceof Error ? error.message : "Unknown error occurred" };
+  }
+
+  postMessage(result);
+};
@@ -1,6 +1,8 @@
 import mupdf from "../utils/mupdf";
 import type { ProtectPDFInput, ProtectPDFOutput } from "../model/models";
 
+type MupdfPDFDocument = InstanceType<typeof mupdf.PDFDocument>;
+
 /**
  * Compute the PDF permissions bitfield (P value) from permission flags.
  * PDF spec: bits 1-2 must be 0, bits 7-8 and 13-32 must be 1.
@@ -37,6 +39,21 @@ function buildEncryptOptions(opts: {
   return parts.join(",");
 }
 
+/**
+ * Writes a MuPDF buffer to disk straight from the WASM heap, then frees it
+ * instead of leaving it to the garbage collector
+ */
+async function writeBuffer(
+  outputPath: string,
+  buf: ReturnType<MupdfPDFDocument["saveToBuffer"]>,
+): Promise<void> {
+  try {
+    await Bun.write(outputPath, buf.asUint8Array());
+  } finally {
+    buf.destroy();
+  }
+}
+
 /**
  * Protects a PDF with password encryption using MuPDF WASM
  * @param input - Input PDF path, output path, and protection options
@@ -70,19 +87,22 @@ export async function protectPDF(input: ProtectPDFInput): Promise<ProtectPDFOutp
 
     const pdfBytes = await Bun.file(input.inputPath).arrayBuffer();
     const doc = mupdf.Document.openDocument(pdfBytes, "application/pdf");
-    const pdfDoc = doc.asPDF();
-    if (!pdfDoc) {
-      return { success: false, error: "Not a valid PDF document" };
-    }
+    try {
+      const pdfDoc = doc.asPDF();
+      if (!pdfDoc) {
+        return { success: false, error: "Not a valid PDF document" };
+      }
 
-    const opts = buildEncryptOptions({
-      userPassword,
-      ownerPassword,
-      permissions: permBits,
-    });
+      const opts = buildEncryptOptions({
+        userPassword,
+        ownerPassword,
+        permissions: permBits,
+      });
 
-    const buf = pdfDoc.saveToBuffer(opts);
-    await Bun.write(input.outputPath, buf.asUint8Array());
+      await writeBuffer(input.outputPath, pdfDoc.saveToBuffer(opts));
+    } finally {
+      doc.destroy();
+    }
 
     return {
       success: true,
@@ -111,22 +131,29 @@ export async function unprotectPDF(
   try {
     const pdfBytes = await Bun.file(inputPath).arrayBuffer();
     const doc = mupdf.Document.openDocument(pdfBytes, "application/pdf");
+    try {
+      if (doc.needsPassword()) {
+        const auth = doc.authenticatePassword(password);
+        if (auth === 0) {
+          return { success: false, error: "Incorrect password" };
+        }
+      }
 
-    if (doc.needsPassword()) {
-      const auth = doc.authenticatePassword(password);
-      if (auth === 0) {
-        return { success: false, error: "Incorrect password" };
+      const pdfDoc = doc.asPDF();
+      if (!pdfDoc) {
+        return { success: false, error: "Not a valid PDF document" };
       }
-    }
 
-    const pdfDoc = doc.asPDF();
-    if (!pdfDoc) {
-      return { success: false, error: "Not a valid PDF document" };
+      // Nothing to remove: copy the file as-is instead of re-serializing every object
+      if (pdfDoc.getTrailer().get("Encrypt").isNull()) {
+        await Bun.write(outputPath, pdfBytes);
+      } else {
+        await writeBuffer(outputPath, pdfDoc.saveToBuffer("decrypt"));
+      }
+    } finally {
+      doc.destroy();
     }
 
-    const buf = pdfDoc.saveToBuffer("decrypt");
-    await Bun.write(outputPath, buf.asUint8Array());
-
     return {
       success: true,
       outputPath,
@@ -31,6 +31,10 @@ interface RendererOutputWriter {
 
 const documentCache = new Map<string, CachedDocument>();
 const imageCache = new Map<string, CachedPreviewImage>();
+// Base64 payload per rendered PNG, so re-displaying a cached page skips re-encoding. Each entry
+// is about 1.33x its PNG and lives as long as the PNG does, so with imageCache full this holds
+// up to MAX_IMAGE_CACHE_ENTRIES extra payloads; evicted PNGs take their payload with them.
+const base64PayloadCache = new WeakMap<Uint8Array, string>();
 
 const clamp = (value: number, min: number, max: number) => Math.min(Math.max(value, min), max);
 
@@ -77,14 +81,14 @@ const buildDeleteSequence = (mode: "A" | "Z", value?: number) => {
   return `\u001b_Ga=d,d=Z,z=${value ?? 0},q=2\u001b\\`;
 };
 
-const chunkBase64 = (payload: string) => {
-  const chunks: string[] = [];
+const getBase64Payload = (png: Uint8Array) => {
+  const cached = base64PayloadCache.get(png);
+  if (cached) return cached;
 
-  for (let index = 0; index < payload.length; index += KITTY_CHUNK_SIZE) {
-    chunks.push(payload.slice(index, index + KITTY_CHUNK_SIZE));
-  }
-
-  return chunks;
+  // Wrap the existing bytes instead of copying them into a new Buffer
+  const payload = Buffer.from(png.buffer, png.byteOffset, png.byteLength).toString("base64");
+  base64PayloadCache.set(png, payload);
+  return payload;
 };
 
 export const getCellPixelSize = (renderer: CliRenderer): CellPixelSize => {
@@ -248,31 +252,31 @@ export const buildKittyTransmitSequence = (
   zIndex: number,
   previousZIndex: number | null,
 ) => {
-  const base64Payload = Buffer.from(png).toString("base64");
-  const chunks = chunkBase64(base64Payload);
-  let sequence = `\u001b[s\u001b[${placement.row};${placement.column}H`;
-
-  chunks.forEach((chunk, index) => {
-    const hasMore = index < chunks.length - 1 ? 1 : 0;
-
-    if (index === 0) {
-      const placementParameters = buildPlacementParameters(placement);
-      const placementPrefix = placementParameters ? `${placementParameters},` : "";
-
-      sequence += `\u001b_Ga=T,f=100,${placementPrefix}C=1,q=2,z=${zIndex},m=${hasMore};${chunk}\u001b\\`;
-      return;
+  const base64Payload = getBase64Payload(png);
+  const placementParameters = buildPlacementParameters(placement);
+  const placementPrefix = placementParameters ? `${placementParameters},` : "";
+  const parts = [`\u001b[s\u001b[${placement.row};${placement.column}H`];
+
+  for (let offset = 0; offset < base64Payload.length; offset += KITTY_CHUNK_SIZE) {
+    const chunk = base64Payload.slice(offset, offset + KITTY_CHUNK_SIZE);
+    const hasMore = offset + KITTY_CHUNK_SIZE < base64Payload.length ? 1 : 0;
+
+    if (offset === 0) {
+      parts.push(
+        `\u001b_Ga=T,f=100,${placementPrefix}C=1,q=2,z=${zIndex},m=${hasMore};${chunk}\u001b\\`,
+      );
+    } else {
+      parts.push(`\u001b_Gq=2,m=${hasMore};${chunk}\u001b\\`);
     }
+  }
 
-    sequence += `\u001b_Gq=2,m=${hasMore};${chunk}\u001b\\`;
-  });
-
-  sequence += "\u001b[u";
+  parts.push("\u001b[u");
 
   if (previousZIndex !== null) {
-    sequence += buildDeleteSequence("Z", previousZIndex);
+    parts.push(buildDeleteSequence("Z", previousZIndex));
   }
 
-  return sequence;
+  return parts.join("");
 };
 
 export const buildKittyDeleteSequence = (zIndex: number | null) =>
@@ -2,6 +2,8 @@ import { PDFDocument } from "pdf-lib";
 import { join, basename } from "path";
 import { linuxScript, osaScript, OUTPUT_DIR, windowsScript } from "../constants/constants";
 import { mkdir, rm, stat } from "fs/promises";
+import { readFileSync } from "fs";
+import { availableParallelism } from "os";
 import type { MouseEvent } from "@opentui/core";
 import type { Setter } from "solid-js";
 
@@ -25,6 +27,63 @@ export const chunkArray = (array: Array<any>, chunkSize: number) => {
   );
 };
 
+/**
+ * Read the CPU quota imposed by the container cgroup (v2 or v1), if any.
+ * Returns null when there is no quota or the files are not readable.
+ */
+const readCgroupCpuLimit = (): number | null => {
+  const readQuota = (path: string, periodPath?: string): number | null => {
+    try {
+      const raw = readFileSync(path, "utf8").trim();
+      const [quota, period] = periodPath
+        ? [raw, readFileSync(periodPath, "utf8").trim()]
+        : raw.split(/\s+/);
+      const quotaValue = Number(quota);
+      const periodValue = Number(period);
+      if (!(quotaValue > 0) || !(periodValue > 0)) return null; // "max" or -1 means unlimited
+      return Math.max(1, Math.floor(quotaValue / periodValue));
+    } catch {
+      return null;
+    }
+  };
+
+  return (
+    readQuota("/sys/fs/cgroup/cpu.max") ??
+    readQuota("/sys/fs/cgroup/cpu/cpu.cfs_quota_us", "/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+  );
+};
+
+/**
+ * Number of workers to use for a batch of CPU-bound tasks.
+ * Bounded by the available cores, the cgroup CPU quota, and the task count.
+ */
+export const getMaxWorkers = (taskCount: number): number => {
+  const cgroupLimit = readCgroupCpuLimit();
+  const cores = availableParallelism();
+  const cpus = cgroupLimit ? Math.min(cores, cgroupLimit) : cores;
+  return Math.max(1, Math.min(cpus, taskCount));
+};
+
+/**
+ * Split an array into `count` contiguous blocks whose sizes differ by at most one
+ * (the first `length % count` blocks get the extra item). Empty blocks are dropped.
+ */
+export const splitIntoBlocks = <T>(array: T[], count: number): T[][] => {
+  const blocks = Math.max(1, Math.min(count, array.length));
+  const baseSize = Math.floor(array.length / blocks);
+  const remainder = array.length % blocks;
+  const result: T[][] = [];
+  let start = 0;
+
+  for (let i = 0; i < blocks && start < array.length; i++) {
+    const size = baseSize + (i < remainder ? 1 : 0);
+    result.push(array.slice(start, start + size));
+    start += size;
+  }
+
+  return result;
+};
+
 export const formatFileSize = (bytes: number) => {
   const units = ["B", "KB", "MB", "GB"];
   let size = bytes;
@@ -250,6 +309,32 @@ export const closeFileTracking = (filePath: string) => {
   openedFiles.delete(filePath);
 };
 
+/**
+ * Parses a page selection such as "1, 3, 5-8" into sorted, unique 1-based page numbers.
+ * Every comma-separated entry must be N or N-M, otherwise the whole selection is rejected
+ * and [] is returned. Pages are clamped to [1, maxPage] before ranges are expanded, so a
+ * range never costs more than maxPage iterations; an unknown page count (0) selects nothing.
+ */
+export const parsePageSelection = (input: string, maxPage = 0): number[] => {
+  const pages = new Set<number>();
+
+  for (const entry of input.split(",")) {
+    if (!entry.trim()) continue;
+
+    const match = /^\s*(\d+)\s*(?:-\s*(\d+)\s*)?$/.exec(entry);
+    if (!match) return [];
+
+    const from = Number(match[1]);
+    const to = match[2] === undefined ? from : Number(match[2]);
+    const last = Math.min(maxPage, Math.max(from, to));
+    for (let page = Math.max(1, Math.min(from, to)); page <= last; page++) {
+      pages.add(page);
+    }
+  }
+
+  return [...pages].sort((a, b) => a - b);
+};
+
 export const unescapePath = (path: string): string => path.replace(/\\(.)/g, "$1");
 
 export async function savePdfDocument(pdfDoc: PDFDocument, outputPath: string): Promise<void> {
@@ -0,0 +1,113 @@
+import type { WorkerErrorResult } from "../model/models";
+
+// Idle workers per worker script URL, kept alive so back-to-back jobs load MuPDF WASM only once
+const idleWorkers = new Map<string, Worker[]>();
+// Pending termination timer of each idle worker
+const idleTimers = new Map<Worker, ReturnType<typeof setTimeout>>();
+
+// Idle workers are terminated after this long, since each one holds a WASM heap that
+// stays at the size of the largest job it ran
+const DEFAULT_WORKER_IDLE_TIMEOUT_MS = 30_000;
+let workerIdleTimeoutMs = DEFAULT_WORKER_IDLE_TIMEOUT_MS;
+
+const acquireWorker = (url: string): Worker => {
+  const worker = idleWorkers.get(url)?.pop();
+  if (!worker) return new Worker(url);
+
+  clearTimeout(idleTimers.get(worker));
+  idleTimers.delete(worker);
+  worker.ref();
+  return worker;
+};
+
+const releaseWorker = (url: string, worker: Worker) => {
+  // Idle pooled workers must not keep the process alive
+  worker.unref();
+  const idle = idleWorkers.get(url) ?? [];
+  idle.push(worker);
+  idleWorkers.set(url, idle);
+
+  const timer = setTimeout(() => {
+    idleTimers.delete(worker);
+    const index = idle.indexOf(worker);
+    if (index !== -1) idle.splice(index, 1);
+    worker.terminate();
+  }, workerIdleTimeoutMs);
+  timer.unref();
+  idleTimers.set(worker, timer);
+};
+
+/**
+ * Sets how long released workers stay pooled before being terminated
+ * @param ms - Idle timeout in milliseconds (defaults to 30 seconds)
+ */
+export function setWorkerIdleTimeout(ms = DEFAULT_WORKER_IDLE_TIMEOUT_MS): void {
+  workerIdleTimeoutMs = ms;
+}
+
+/**
+ * Resolves a worker script that sits next to the calling module. From source the caller
+ * is a .ts file with the worker beside it; in a build the caller is inlined into the
+ * entry bundle and scripts/build.ts emits each worker next to that bundle as .js.
+ * @param name - Worker file name without extension (e.g. "compress.worker")
+ * @param callerUrl - import.meta.url of the calling module
+ */
+export function resolveWorkerUrl(name: string, callerUrl: string): string {
+  const ext = new URL(callerUrl).pathname.endsWith(".ts") ? ".ts" : ".js";
+  return new URL(`./${name}${ext}`, callerUrl).href;
+}
+
+/**
+ * Runs one task per worker from a persistent pool and collects the results in task order.
+ * Workers are reused across calls; a worker that fails is terminated rather than returned.
+ * Every task is settled before the first failure is thrown, so a caller falling back to
+ * in-process work never races a worker that is still running.
+ * @param url - Worker script URL
+ * @param tasks - Messages to post, one per worker
+ * @param getTransferables - Buffers of a task to move to its worker instead of copying
+ * @returns The worker replies, in the same order as tasks
+ */
+export async function runInWorkers<TTask, TResult>(
+  url: string,
+  tasks: TTask[],
+  getTransferables?: (task: TTask) => Transferable[],
+): Promise<TResult[]> {
+  const runTask = (task: TTask) =>
+    new Promise<TResult>((resolve, reject) => {
+      const worker = acquireWorker(url);
+
+      worker.onmessage = (event: MessageEvent<TResult | WorkerErrorResult>) => {
+        const data = event.data;
+        if (data && typeof data === "object" && "error" in data) {
+          worker.terminate();
+          reject(new Error(data.error));
+          return;
+        }
+        releaseWorker(url, worker);
+        resolve(data as TResult);
+      };
+      worker.onerror = (event) => {
+        worker.terminate();
+        reject(new Error(event.message));
+      };
+
+      worker.postMessage(task, getTransferables?.(task) ?? []);
+    });
+
+  const settled = await Promise.allSettled(tasks.map(runTask));
+  const failure = settled.find((result) => result.status === "rejected");
+  if (failure) throw failure.reason;
+  return settled.map((result) => (result as PromiseFulfilledResult<TResult>).value);
+}
+
+/**
+ * Terminates all idle pooled workers
+ */
+export function terminateIdleWorkers(): void {
+  for (const workers of idleWorkers.values()) {
+    for (const worker of workers) worker.terminate();
+  }
+  for (const timer of idleTimers.values()) clearTimeout(timer);
+  idleWorkers.clear();
+  idleTimers.clear();
+}
@@ -2,6 +2,8 @@ import { afterEach, describe, expect, it } from "bun:test";
 import { join } from "path";
 import {
   cleanupTempDir,
+  createCorruptJpegPdf,
+  createImagePdf,
   createPdf,
   createTempDir,
   getPdfPageCount,
@@ -41,6 +43,197 @@ describe("compress tool", () => {
     }
   });
 
+  it("re-encodes large raster images as jpeg", async () => {
+    const { compressPDF } = await import("../../src/tools/compress");
+    tempDir = await createTempDir("tuidf-compress-images-");
+
+    const input = join(tempDir, "images.pdf");
+    const output = join(tempDir, "compressed.pdf");
+    await createImagePdf(input);
+
+    const result = await compressPDF({ inputPath: input, outputPath: output });
+
+    expect(result.success).toBe(true);
+    if (result.success) {
+      expect(result.compressedSize).toBeLessThan(result.originalSize ?? 0);
+      const pdfText = Buffer.from(await Bun.file(output).arrayBuffer()).toString("latin1");
+      expect(pdfText).toContain("/DCTDecode");
+      expect(await getPdfPageCount(output)).toBe(1);
+    }
+  });
+
+  it("downscales oversized images to the maximum dimension at medium quality", async () => {
+    const { compressPDF } = await import("../../src/tools/compress");
+    tempDir = await createTempDir("tuidf-compress-downscale-");
+
+    const input = join(tempDir, "wide-image.pdf");
+    const output = join(tempDir, "compressed.pdf");
+    await createImagePdf(input, 2400, 300);
+
+    const result = await compressPDF({ inputPath: input, outputPath: output });
+
+    expect(result.success).toBe(true);
+    const pdfText = Buffer.from(await Bun.file(output).arrayBuffer()).toString("latin1");
+    expect(pdfText).toMatch(/\/Width 2000\b/);
+    expect(pdfText).toMatch(/\/Height 250\b/);
+  });
+
+  it("keeps full resolution at high quality", async () => {
+    const { compressPDF } = await import("../../src/tools/compress");
+    tempDir = await createTempDir("tuidf-compress-high-");
+
+    const input = join(tempDir, "wide-image.pdf");
+    const output = join(tempDir, "compressed.pdf");
+    await createImagePdf(input, 2400, 300);
+
+    const result = await compressPDF({ inputPath: input, outputPath: output, quality: "high" });
+
+    expect(result.success).toBe(true);
+    const pdfText = Buffer.from(await Bun.file(output).arrayBuffer()).toString("latin1");
+    expect(pdfText).toMatch(/\/Width 2400\b/);
+  });
+
+  it("shares one re-encoded stream between identical images", async () => {
+    const { compressPDF } = await import("../../src/tools/compress");
+    tempDir = await createTempDir("tuidf-compress-duplicates-");
+
+    const input = join(tempDir, "duplicates.pdf");
+    const output = join(tempDir, "compressed.pdf");
+    await createImagePdf(input, 600, 600, 3);
+
+    const result = await compressPDF({ inputPath: input, outputPath: output });
+
+    expect(result.success).toBe(true);
+    const pdfText = Buffer.from(await Bun.file(output).arrayBuffer()).toString("latin1");
+    expect(pdfText.match(/\/DCTDecode/g)).toHaveLength(1);
+  });
+
+  it("leaves images below the pixel threshold untouched", async () => {
+    const { compressPDF } = await import("../../src/tools/compress");
+    tempDir = await createTempDir("tuidf-compress-small-images-");
+
+    const input = join(tempDir, "small-image.pdf");
+    const output = join(tempDir, "compressed.pdf");
+    await createImagePdf(input, 200, 200);
+
+    const result = await compressPDF({ inputPath: input, outputPath: output });
+
+    expect(result.success).toBe(true);
+    const pdfText = Buffer.from(await Bun.file(output).arrayBuffer()).toString("latin1");
+    expect(pdfText).not.toContain("/DCTDecode");
+  });
+
+  it("leaves spot colour images untouched", async () => {
+    const { compressPDF } = await import("../../src/tools/compress");
+    tempDir = await createTempDir("tuidf-compress-separation-");
+
+    const input = join(tempDir, "separation.pdf");
+    const output = join(tempDir, "compressed.pdf");
+    const tint = { FunctionType: 2, Domain: [0, 1], C0: [0, 0, 0, 0], C1: [0, 1, 0, 0], N: 1 };
+    await createImagePdf(input, 600, 600, 1, ["Separation", "Spot", "DeviceCMYK", tint], 1);
+
+    const result = await compressPDF({ inputPath: input, outputPath: output });
+
+    expect(result.success).toBe(true);
+    const pdfText = Buffer.from(await Bun.file(output).arrayBuffer()).toString("latin1");
+    expect(pdfText).not.toContain("/DCTDecode");
+  });
+
+  it("leaves 1-bit images untouched", async () => {
+    const { compressPDF } = await import("../../src/tools/compress");
+    tempDir = await createTempDir("tuidf-compress-bilevel-");
+
+    const input = join(tempDir, "bilevel.pdf");
+    const output = join(tempDir, "compressed.pdf");
+    await createImagePdf(input, 2400, 2400, 1, "DeviceGray", 1, 1);
+
+    const result = await compressPDF({ inputPath: input, outputPath: output });
+
+    expect(result.success).toBe(true);
+    const pdfText = Buffer.from(await Bun.file(output).arrayBuffer()).toString("latin1");
+    expect(pdfText).not.toContain("/DCTDecode");
+  });
+
+  it("uses the requested quality for re-encoded images", async () => {
+    const { compressPDF } = await import("../../src/tools/compress");
+    tempDir = await createTempDir("tuidf-compress-quality-");
+
+    const input = join(tempDir, "images.pdf");
+    await createImagePdf(input);
+
+    const low = await compressPDF({
+      inputPath: input,
+      outputPath: join(tempDir, "low.pdf"),
+      quality: "low",
+    });
+    const high = await compressPDF({
+      inputPath: input,
+      outputPath: join(tempDir, "high.pdf"),
+      quality: "high",
+    });
+
+    expect(low.success).toBe(true);
+    expect(high.success).toBe(true);
+    expect(low.compressedSize ?? 0).toBeLessThan(high.compressedSize ?? 0);
+  });
+
+  it("re-encodes several jpeg streams through workers", async () => {
+    const { compressPDF } = await import("../../src/tools/compress");
+    tempDir = await createTempDir("tuidf-compress-workers-");
+
+    const input = join(tempDir, "images.pdf");
+    const jpegInput = join(tempDir, "jpeg-images.pdf");
+    const output = join(tempDir, "compressed.pdf");
+    await createImagePdf(input, 600, 600, 3);
+
+    // First pass turns the raw images into DCTDecode streams the workers can take
+    const firstPass = await compressPDF({
+      inputPath: input,
+      outputPath: jpegInput,
+      quality: "high",
+    });
+    const secondPass = await compressPDF({
+      inputPath: jpegInput,
+      outputPath: output,
+      quality: "low",
+    });
+
+    expect(firstPass.success).toBe(true);
+    expect(secondPass.success).toBe(true);
+    if (secondPass.success) {
+      expect(secondPass.compressedSize).toBeLessThan(secondPass.originalSize ?? 0);
+      expect(await getPdfPageCount(output)).toBe(1);
+    }
+  });
+
+  it("skips images that cannot be decoded instead of failing", async () => {
+    const { compressPDF } = await import("../../src/tools/compress");
+    tempDir = await createTempDir("tuidf-compress-corrupt-image-");
+
+    const input = join(tempDir, "corrupt.pdf");
+    const output = join(tempDir, "compressed.pdf");
+    await createCorruptJpegPdf(input);
+
+    const result = await compressPDF({ inputPath: input, outputPath: output });
+
+    expect(result.success).toBe(true);
+    expect(await getPdfPageCount(output)).toBe(1);
+  });
+
+  it("skips undecodable jpeg streams handled by workers", async () => {
+    const { compressPDF } = await import("../../src/tools/compress");
+    tempDir = await createTempDir("tuidf-compress-corrupt-workers-");
+
+    const input = join(tempDir, "corrupt.pdf");
+    const output = join(tempDir, "compressed.pdf");
+    await createCorruptJpegPdf(input, 4);
+
+    const result = await compressPDF({ inputPath: input, outputPath: output });
+
+    expect(result.success).toBe(true);
+    expect(await getPdfPageCount(output)).toBe(1);
+  });
+
   it("rejects inputs that cannot be treated as pdf documents", async () => {
     const { compressPDF } = await import("../../src/tools/compress");
     tempDir = await createTempDir("tuidf-compress-invalid-doc-");
@@ -49,7 +242,7 @@ describe("compress tool", () => {
     await createPdf(input, 1);
 
     const result = await withMockedOpenDocument(
-      () => ({ asPDF: () => null }),
+      () => ({ asPDF: () => null, destroy: () => {} }),
       () =>
         compressPDF({
           inputPath: input,
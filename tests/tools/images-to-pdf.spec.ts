@@ -5,6 +5,7 @@ import {
   cleanupTempDir,
   createJpg,
   createPng,
+  createRgbPng,
   createTempDir,
   getPdfPageCount,
 } from "../utils/test-utils";
@@ -54,6 +55,53 @@ describe("images-to-pdf tool", () => {
     }
   });
 
+  it("embeds jpeg bytes unchanged instead of re-encoding them", async () => {
+    const { imagesToPDF } = await import("../../src/tools/images-to-pdf");
+    tempDir = await createTempDir("tuidf-images-to-pdf-jpeg-passthrough-");
+
+    const jpgPath = join(tempDir, "pixel.jpg");
+    const output = join(tempDir, "jpeg.pdf");
+    await createJpg(jpgPath);
+
+    const result = await imagesToPDF({ inputPaths: [jpgPath], outputPath: output });
+
+    expect(result.success).toBe(true);
+    const latin1 = (bytes: ArrayBuffer) => Buffer.from(bytes).toString("latin1");
+    const pdfText = latin1(await Bun.file(output).arrayBuffer());
+    expect(pdfText).toContain("/DCTDecode");
+    expect(pdfText).toContain(latin1(await Bun.file(jpgPath).arrayBuffer()));
+  });
+
+  it("embeds rgb png data unchanged instead of decoding it", async () => {
+    const { imagesToPDF, readPngImageData } = await import("../../src/tools/images-to-pdf");
+    tempDir = await createTempDir("tuidf-images-to-pdf-png-passthrough-");
+
+    const pngPath = join(tempDir, "rgb.png");
+    const output = join(tempDir, "png.pdf");
+    await createRgbPng(pngPath, 3, 2);
+
+    const pngData = readPngImageData(new Uint8Array(await Bun.file(pngPath).arrayBuffer()));
+    expect(pngData).toMatchObject({ width: 3, height: 2, components: 3, bitDepth: 8 });
+
+    const result = await imagesToPDF({ inputPaths: [pngPath], outputPath: output });
+
+    expect(result.success).toBe(true);
+    const pdfText = Buffer.from(await Bun.file(output).arrayBuffer()).toString("latin1");
+    expect(pdfText).toContain("/Predictor 15");
+    expect(pdfText).toContain(Buffer.from(pngData!.data).toString("latin1"));
+    expect(await getFirstPageSize(output)).toEqual({ width: 3, height: 2 });
+  });
+
+  it("leaves pngs with alpha to the image decoder", async () => {
+    const { readPngImageData } = await import("../../src/tools/images-to-pdf");
+    tempDir = await createTempDir("tuidf-images-to-pdf-png-alpha-");
+
+    const pngPath = join(tempDir, "pixel.png");
+    await createPng(pngPath);
+
+    expect(readPngImageData(new Uint8Array(await Bun.file(pngPath).arrayBuffer()))).toBeNull();
+  });
+
   it("supports a4 and letter output sizes", async () => {
     const { imagesToPDF } = await import("../../src/tools/images-to-pdf");
     tempDir = await createTempDir("tuidf-images-to-pdf-page-sizes-");
@@ -86,6 +134,61 @@ describe("images-to-pdf tool", () => {
     expect(Math.round(letterPage.height)).toBe(792);
   });
 
+  it("places non-square images at their scaled size on a4 and letter pages", async () => {
+    const { imagesToPDF } = await import("../../src/tools/images-to-pdf");
+    const { default: mupdf } = await import("../../src/utils/mupdf");
+    tempDir = await createTempDir("tuidf-images-to-pdf-placement-");
+
+    // Centring a 1x5 image on a4 leaves a 5.7e-14 vertical offset
+    const pngPath = join(tempDir, "tall.png");
+    await createRgbPng(pngPath, 1, 5);
+
+    const getImageBox = async (pageSize: "a4" | "letter") => {
+      const output = join(tempDir, `${pageSize}.pdf`);
+      const result = await imagesToPDF({ inputPaths: [pngPath], outputPath: output, pageSize });
+      expect(result.success).toBe(true);
+
+      const pdfBytes = await Bun.file(output).arrayBuffer();
+      const doc = mupdf.Document.openDocument(pdfBytes, "application/pdf");
+      let box: number[] = [];
+      doc
+        .loadPage(0)
+        .toStructuredText("preserve-images")
+        .walk({ onImageBlock: (bbox) => (box = [...bbox]) });
+      doc.destroy();
+      return box;
+    };
+
+    const expectBox = (box: number[], expected: number[]) =>
+      expected.forEach((value, i) => expect(box[i]).toBeCloseTo(value, 1));
+
+    expectBox(await getImageBox("a4"), [213.451, 0, 381.829, 841.89]);
+    expectBox(await getImageBox("letter"), [226.8, 0, 385.2, 792]);
+  });
+
+  it("reads jpeg frame info from the SOF header", async () => {
+    const { readJpegInfo } = await import("../../src/tools/images-to-pdf");
+    tempDir = await createTempDir("tuidf-images-to-pdf-sof-");
+
+    const jpgPath = join(tempDir, "pixel.jpg");
+    const pngPath = join(tempDir, "pixel.png");
+    await createJpg(jpgPath);
+    await createPng(pngPath);
+
+    const jpgBytes = new Uint8Array(await Bun.file(jpgPath).arrayBuffer());
+    const pngBytes = new Uint8Array(await Bun.file(pngPath).arrayBuffer());
+
+    expect(readJpegInfo(jpgBytes)).toEqual({ width: 1, height: 1, components: 3, precision: 8 });
+
+    // Same frame declared with 12-bit samples
+    const twelveBit = jpgBytes.slice();
+    const sof = twelveBit.findIndex((b, i) => b === 0xff && twelveBit[i + 1] === 0xc0);
+    twelveBit[sof + 4] = 12;
+    expect(readJpegInfo(twelveBit)?.precision).toBe(12);
+    expect(readJpegInfo(pngBytes)).toBeNull();
+    expect(readJpegInfo(jpgBytes.subarray(0, 20))).toBeNull();
+  });
+
   it("filters supported image extensions", async () => {
     const { filterValidImages } = await import("../../src/tools/images-to-pdf");
 
@@ -39,6 +39,27 @@ describe("pdf-to-images tool", () => {
     }
   });
 
+  it("renders png pages without alpha unless transparency is requested", async () => {
+    const { pdfToImages } = await import("../../src/tools/pdf-to-images");
+    tempDir = await createTempDir("tuidf-pdf-to-images-alpha-");
+
+    const input = join(tempDir, "input.pdf");
+    await createPdf(input, 1);
+
+    const opaque = await pdfToImages({ inputPath: input, outputDir: join(tempDir, "opaque") });
+    const transparent = await pdfToImages({
+      inputPath: input,
+      outputDir: join(tempDir, "transparent"),
+      transparent: true,
+    });
+
+    // Byte 25 is the IHDR colour type: 2 = RGB, 6 = RGBA
+    const colorType = async (filePath?: string) =>
+      new Uint8Array(await Bun.file(filePath ?? "").arrayBuffer())[25];
+    expect(await colorType(opaque.outputFiles?.[0])).toBe(2);
+    expect(await colorType(transparent.outputFiles?.[0])).toBe(6);
+  });
+
   it("converts selected pages to jpg", async () => {
     const { pdfToImages } = await import("../../src/tools/pdf-to-images");
     tempDir = await createTempDir("tuidf-pdf-to-images-jpg-");
@@ -67,6 +88,37 @@ describe("pdf-to-images tool", () => {
     }
   });
 
+  it("renders larger page sets through workers and keeps page order", async () => {
+    const { pdfToImages } = await import("../../src/tools/pdf-to-images");
+    tempDir = await createTempDir("tuidf-pdf-to-images-workers-");
+
+    const input = join(tempDir, "input.pdf");
+    const outputDir = join(tempDir, "worker-out");
+    await createPdf(input, 5);
+
+    const result = await pdfToImages({
+      inputPath: input,
+      outputDir,
+      format: "jpg",
+      dpi: 72,
+      pages: [5, 1, 3, 4],
+    });
+
+    expect(result.success).toBe(true);
+    if (result.success) {
+      expect(result.totalImages).toBe(4);
+      expect(result.outputFiles?.map((filePath) => filePath.split("_page_")[1])).toEqual([
+        "5.jpg",
+        "1.jpg",
+        "3.jpg",
+        "4.jpg",
+      ]);
+      for (const filePath of result.outputFiles ?? []) {
+        expect(await Bun.file(filePath).exists()).toBe(true);
+      }
+    }
+  });
+
   it("returns failure when input PDF is missing", async () => {
     const { pdfToImages } = await import("../../src/tools/pdf-to-images");
 
@@ -59,7 +59,7 @@ describe("protect tool", () => {
     await createPdf(input, 1);
 
     const result = await withMockedOpenDocument(
-      () => ({ asPDF: () => null }),
+      () => ({ asPDF: () => null, destroy: () => {} }),
       () =>
         protectPDF({
           inputPath: input,
@@ -85,6 +85,7 @@ describe("protect tool", () => {
       () => ({
         needsPassword: () => false,
         asPDF: () => null,
+        destroy: () => {},
       }),
       () => unprotectPDF(input, join(tempDir, "out.pdf"), "reader"),
     );
@@ -95,6 +96,22 @@ describe("protect tool", () => {
     }
   });
 
+  it("copies unencrypted pdfs unchanged when unprotecting", async () => {
+    const { unprotectPDF } = await import("../../src/tools/protect");
+    tempDir = await createTempDir("tuidf-unprotect-plain-");
+
+    const input = join(tempDir, "input.pdf");
+    const output = join(tempDir, "output.pdf");
+    await createPdf(input, 2);
+
+    const result = await unprotectPDF(input, output, "");
+
+    expect(result.success).toBe(true);
+    expect(Buffer.from(await Bun.file(output).arrayBuffer())).toEqual(
+      Buffer.from(await Bun.file(input).arrayBuffer()),
+    );
+  });
+
   it("rejects an incorrect password for a protected pdf", async () => {
     const { protectPDF, unprotectPDF } = await import("../../src/tools/protect");
     tempDir = await createTempDir("tuidf-protect-wrong-password-");
@@ -136,9 +153,11 @@ describe("protect tool", () => {
             saveOptions = options;
             return {
               asUint8Array: () => new Uint8Array([37, 80, 68, 70]),
+              destroy: () => {},
             };
           },
         }),
+        destroy: () => {},
       }),
       () =>
         protectPDF({
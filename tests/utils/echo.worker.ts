@@ -0,0 +1,13 @@
+declare var self: Worker;
+
+// Identifies this worker instance, so tests can tell whether a worker was reused
+const instanceId = crypto.randomUUID();
+
+// Test worker: doubles the number it receives, or replies with an error for negatives
+self.onmessage = (event: MessageEvent<number>) => {
+  if (event.data < 0) {
+    postMessage({ error: `negative input: ${event.data}` });
+    return;
+  }
+  postMessage({ value: event.data * 2, instanceId });
+};
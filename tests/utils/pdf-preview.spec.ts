@@ -0,0 +1,80 @@
+import { describe, expect, it } from "bun:test";
+import { buildKittyTransmitSequence } from "../../src/utils/pdf-preview";
+
+// Reference copy of the transmit sequence as it was built before payload caching
+const buildLegacyTransmitSequence = (
+  png: Uint8Array,
+  placement: Parameters<typeof buildKittyTransmitSequence>[1],
+  zIndex: number,
+  previousZIndex: number | null,
+) => {
+  const payload = Buffer.from(png).toString("base64");
+  const chunks: string[] = [];
+  for (let index = 0; index < payload.length; index += 4096) {
+    chunks.push(payload.slice(index, index + 4096));
+  }
+
+  const parameters = [
+    placement.offsetX > 0 ? `X=${placement.offsetX}` : null,
+    placement.offsetY > 0 ? `Y=${placement.offsetY}` : null,
+    "columns" in placement ? `c=${placement.columns}` : `r=${placement.rows}`,
+  ].filter((value): value is string => value !== null);
+  const placementPrefix = parameters.length > 0 ? `${parameters.join(",")},` : "";
+  let sequence = `\u001b[s\u001b[${placement.row};${placement.column}H`;
+
+  chunks.forEach((chunk, index) => {
+    const hasMore = index < chunks.length - 1 ? 1 : 0;
+    sequence +=
+      index === 0
+        ? `\u001b_Ga=T,f=100,${placementPrefix}C=1,q=2,z=${zIndex},m=${hasMore};${chunk}\u001b\\`
+        : `\u001b_Gq=2,m=${hasMore};${chunk}\u001b\\`;
+  });
+
+  sequence += "\u001b[u";
+  if (previousZIndex !== null) {
+    sequence += `\u001b_Ga=d,d=Z,z=${previousZIndex},q=2\u001b\\`;
+  }
+
+  return sequence;
+};
+
+const createBytes = (length: number) => {
+  const bytes = new Uint8Array(length);
+  for (let index = 0; index < length; index++) {
+    bytes[index] = (index * 31 + 7) % 256;
+  }
+  return bytes;
+};
+
+describe("buildKittyTransmitSequence", () => {
+  it("matches the legacy output for a multi-chunk PNG", () => {
+    const png = createBytes(10_000);
+    const placement = { column: 3, row: 2, offsetX: 4, offsetY: 0, columns: 40 };
+
+    const sequence = buildKittyTransmitSequence(png, placement, 5, null);
+
+    expect(sequence).toBe(buildLegacyTransmitSequence(png, placement, 5, null));
+    expect(sequence.match(/\u001b_G/g)?.length).toBe(4);
+    // Cached payload is reused on the second call
+    expect(buildKittyTransmitSequence(png, placement, 5, null)).toBe(sequence);
+  });
+
+  it("matches the legacy output when the payload ends on a chunk boundary", () => {
+    const png = createBytes(3072 * 2);
+    const placement = { column: 1, row: 1, offsetX: 0, offsetY: 6, rows: 20 };
+
+    expect(buildKittyTransmitSequence(png, placement, 2, 1)).toBe(
+      buildLegacyTransmitSequence(png, placement, 2, 1),
+    );
+  });
+
+  it("encodes only the viewed bytes of a subarray", () => {
+    const backing = createBytes(9_000);
+    const png = backing.subarray(1_000, 8_000);
+    const placement = { column: 1, row: 1, offsetX: 0, offsetY: 0, columns: 10 };
+
+    expect(buildKittyTransmitSequence(png, placement, 1, null)).toBe(
+      buildLegacyTransmitSequence(png.slice(), placement, 1, null),
+    );
+  });
+});
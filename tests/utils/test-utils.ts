@@ -1,7 +1,14 @@
 import { mkdtemp, rm } from "fs/promises";
 import { tmpdir } from "os";
 import { join } from "path";
-import { PDFDocument } from "pdf-lib";
+import { deflateSync } from "zlib";
+import {
+  concatTransformationMatrix,
+  drawObject,
+  PDFDocument,
+  popGraphicsState,
+  pushGraphicsState,
+} from "pdf-lib";
 
 export async function createTempDir(prefix = "tuidf-test-"): Promise<string> {
   return mkdtemp(join(tmpdir(), prefix));
@@ -22,6 +29,93 @@ export async function createPdf(filePath: string, pages = 1): Promise<void> {
   await Bun.write(filePath, bytes);
 }
 
+/**
+ * Creates a single-page PDF holding an uncompressed noise image (8-bit RGB unless another
+ * colour space, component count or bit depth is given), which compresses poorly with Flate and
+ * well with JPEG.
+ */
+export async function createImagePdf(
+  filePath: string,
+  width = 600,
+  height = 600,
+  copies = 1,
+  colorSpace: Parameters<PDFDocument["context"]["obj"]>[0] = "DeviceRGB",
+  components = 3,
+  bitsPerComponent = 8,
+): Promise<void> {
+  const pdf = await PDFDocument.create();
+  const pixels = new Uint8Array(
+    Math.ceil((width * components * bitsPerComponent) / 8) * height,
+  );
+  let seed = 42;
+  for (let i = 0; i < pixels.length; i++) {
+    seed = (seed * 1103515245 + 12345) & 0x7fffffff;
+    pixels[i] = seed >> 16;
+  }
+
+  const page = pdf.addPage([width, height]);
+  for (let i = 0; i < copies; i++) {
+    const imageStream = pdf.context.stream(pixels, {
+      Type: "XObject",
+      Subtype: "Image",
+      Width: width,
+      Height: height,
+      ColorSpace: colorSpace,
+      BitsPerComponent: bitsPerComponent,
+    });
+    const name = page.node.newXObject("Im", pdf.context.register(imageStream));
+    page.pushOperators(
+      pushGraphicsState(),
+      concatTransformationMatrix(width, 0, 0, height, 0, 0),
+      drawObject(name),
+      popGraphicsState(),
+    );
+  }
+
+  const bytes = await pdf.save();
+  await Bun.write(filePath, bytes);
+}
+
+/**
+ * Creates a single-page PDF holding DCTDecode image streams that are not valid JPEG
+ * data, one distinct stream per copy
+ */
+export async function createCorruptJpegPdf(filePath: string, copies = 1): Promise<void> {
+  const pdf = await PDFDocument.create();
+  const page = pdf.addPage([600, 600]);
+
+  for (let i = 0; i < copies; i++) {
+    // A JPEG SOI marker followed by noise
+    const data = new Uint8Array(64 * 1024);
+    let seed = 7 + i;
+    for (let j = 0; j < data.length; j++) {
+      seed = (seed * 1103515245 + 12345) & 0x7fffffff;
+      data[j] = seed >> 16;
+    }
+    data.set([0xff, 0xd8, 0xff, 0xe0]);
+
+    const imageStream = pdf.context.stream(data, {
+      Type: "XObject",
+      Subtype: "Image",
+      Width: 600,
+      Height: 600,
+      ColorSpace: "DeviceRGB",
+      BitsPerComponent: 8,
+      Filter: "DCTDecode",
+    });
+    const name = page.node.newXObject("Im", pdf.context.register(imageStream));
+    page.pushOperators(
+      pushGraphicsState(),
+      concatTransformationMatrix(600, 0, 0, 600, 0, 0),
+      drawObject(name),
+      popGraphicsState(),
+    );
+  }
+
+  const bytes = await pdf.save();
+  await Bun.write(filePath, bytes);
+}
+
 export async function getPdfPageCount(filePath: string | undefined): Promise<number> {
   if (!filePath) return 0;
   const bytes = await Bun.file(filePath).arrayBuffer();
@@ -37,6 +131,42 @@ export async function createPng(filePath: string): Promise<void> {
   await Bun.write(filePath, bytes);
 }
 
+/**
+ * Creates an 8-bit RGB PNG with no alpha channel, which images-to-pdf can embed
+ * without decoding.
+ */
+export async function createRgbPng(
+  filePath: string,
+  width: number,
+  height: number,
+): Promise<void> {
+  const chunk = (type: string, data: Uint8Array) => {
+    const body = Buffer.concat([Buffer.from(type, "latin1"), data]);
+    const header = Buffer.alloc(4);
+    header.writeUInt32BE(data.length);
+    const crc = Buffer.alloc(4);
+    crc.writeUInt32BE(Bun.hash.crc32(body));
+    return Buffer.concat([header, body, crc]);
+  };
+
+  const ihdr = Buffer.alloc(13);
+  ihdr.writeUInt32BE(width, 0);
+  ihdr.writeUInt32BE(height, 4);
+  ihdr.set([8, 2, 0, 0, 0], 8); // 8-bit RGB, not interlaced
+
+  // Each scanline: filter type 0, then a gradient of RGB samples
+  const rows = new Uint8Array(height * (1 + width * 3));
+  for (let i = 0; i < rows.length; i++) rows[i] = i % (1 + width * 3) === 0 ? 0 : i & 0xff;
+
+  const png = Buffer.concat([
+    Buffer.from([0x89, 0x50, 0x4e, 0x47, 0x0d, 0x0a, 0x1a, 0x0a]),
+    chunk("IHDR", ihdr),
+    chunk("IDAT", deflateSync(rows)),
+    chunk("IEND", new Uint8Array(0)),
+  ]);
+  await Bun.write(filePath, png);
+}
+
 export async function createJpg(filePath: string): Promise<void> {
   // 1x1 JPEG
   const base64 =
@@ -1,6 +1,6 @@
 import { afterEach, describe, expect, it } from "bun:test";
 import { mkdtemp, rm } from "fs/promises";
-import { tmpdir } from "os";
+import { availableParallelism, tmpdir } from "os";
 import { join } from "path";
 import { stat } from "fs/promises";
 import { truncate } from "node:fs/promises";
@@ -13,12 +13,15 @@ import {
   formatFileSize,
   formatModifiedLabel,
   getFormattedFileMetadata,
+  getMaxWorkers,
   getOutputDir,
   getOutputPath,
   getPageCount,
   handleFileExplorer,
   openFile,
   openOutputFolder,
+  parsePageSelection,
+  splitIntoBlocks,
   unescapePath,
   validateImageFile,
   validatePdfFile,
@@ -83,6 +86,19 @@ describe("utils", () => {
     expect(chunkArray([], 3)).toEqual([]);
   });
 
+  it("splits arrays into balanced contiguous blocks", () => {
+    expect(splitIntoBlocks([1, 2, 3, 4, 5, 6, 7], 3)).toEqual([[1, 2, 3], [4, 5], [6, 7]]);
+    expect(splitIntoBlocks([1, 2], 4)).toEqual([[1], [2]]);
+    expect(splitIntoBlocks([], 3)).toEqual([]);
+  });
+
+  it("bounds worker count by task count and available cores", () => {
+    expect(getMaxWorkers(0)).toBe(1);
+    expect(getMaxWorkers(1)).toBe(1);
+    expect(getMaxWorkers(10_000)).toBeGreaterThanOrEqual(1);
+    expect(getMaxWorkers(10_000)).toBeLessThanOrEqual(availableParallelism());
+  });
+
   it("formats file sizes and modified timestamps", () => {
     expect(formatFileSize(512)).toBe("512 B");
     expect(formatFileSize(1536)).toBe("1.5 KB");
@@ -90,6 +106,26 @@ describe("utils", () => {
     expect(formatModifiedLabel(new Date(2020, 0, 2, 12, 0, 0))).toMatch(/^Updated /);
   });
 
+  it("parses page selections with ranges, clamping and deduplication", () => {
+    expect(parsePageSelection("1, 3, 5-7", 10)).toEqual([1, 3, 5, 6, 7]);
+    expect(parsePageSelection("4-2,3,3", 10)).toEqual([2, 3, 4]);
+    expect(parsePageSelection("0, 8-1000000000", 10)).toEqual([8, 9, 10]);
+    expect(parsePageSelection("abc, , -", 10)).toEqual([]);
+  });
+
+  it("rejects page selections with entries that are not N or N-M", () => {
+    expect(parsePageSelection("1.5", 10)).toEqual([]);
+    expect(parsePageSelection("-3", 10)).toEqual([]);
+    expect(parsePageSelection("2, 4-", 10)).toEqual([]);
+    expect(parsePageSelection("1, 2x", 10)).toEqual([]);
+    expect(parsePageSelection(" 2 - 3 , 1,", 10)).toEqual([1, 2, 3]);
+  });
+
+  it("selects nothing without a page count instead of expanding unbounded ranges", () => {
+    expect(parsePageSelection("1-1000000000")).toEqual([]);
+    expect(parsePageSelection("1, 2", 0)).toEqual([]);
+  });
+
   it("unescapes shell-escaped paths", () => {
     expect(unescapePath("/tmp/My\\ File.pdf")).toBe("/tmp/My File.pdf");
   });
@@ -0,0 +1,56 @@
+import { afterEach, describe, expect, it } from "bun:test";
+import {
+  resolveWorkerUrl,
+  runInWorkers,
+  setWorkerIdleTimeout,
+  terminateIdleWorkers,
+} from "../../src/utils/worker-pool";
+
+type EchoResult = { value: number; instanceId: string };
+
+const ECHO_WORKER_URL = new URL("./echo.worker.ts", import.meta.url).href;
+
+afterEach(() => {
+  terminateIdleWorkers();
+  setWorkerIdleTimeout();
+});
+
+describe("worker pool", () => {
+  it("returns worker replies in task order", async () => {
+    const results = await runInWorkers<number, EchoResult>(ECHO_WORKER_URL, [3, 1, 2]);
+    expect(results.map((result) => result.value)).toEqual([6, 2, 4]);
+  });
+
+  it("reuses workers across calls", async () => {
+    const [first] = await runInWorkers<number, EchoResult>(ECHO_WORKER_URL, [1]);
+    const [second] = await runInWorkers<number, EchoResult>(ECHO_WORKER_URL, [5]);
+    expect(second?.value).toBe(10);
+    expect(second?.instanceId).toBe(first!.instanceId);
+  });
+
+  it("terminates workers that stay idle past the timeout", async () => {
+    setWorkerIdleTimeout(50);
+    const [first] = await runInWorkers<number, EchoResult>(ECHO_WORKER_URL, [1]);
+    await Bun.sleep(200);
+    const [second] = await runInWorkers<number, EchoResult>(ECHO_WORKER_URL, [1]);
+    expect(second?.instanceId).not.toBe(first!.instanceId);
+  });
+
+  it("rejects with the error a worker replies with", async () => {
+    await expect(runInWorkers(ECHO_WORKER_URL, [1, -1])).rejects.toThrow("negative input: -1");
+  });
+
+  it("rejects when a worker script cannot be loaded, so callers can fall back", async () => {
+    const missingUrl = new URL("./missing.worker.ts", import.meta.url).href;
+    await expect(runInWorkers(missingUrl, [1])).rejects.toThrow();
+  });
+
+  it("resolves workers next to the caller, as .ts from source and .js from a bundle", () => {
+    expect(resolveWorkerUrl("compress.worker", "file:///app/src/tools/compress.ts")).toBe(
+      "file:///app/src/tools/compress.worker.ts",
+    );
+    expect(resolveWorkerUrl("compress.worker", "file:///app/dist/index.js")).toBe(
+      "file:///app/dist/compress.worker.js",
+    );
+  });
+});